@@ -34,7 +34,7 @@ relaying load and save functions to the underlying data sets.
 import copy
 import logging
 from functools import partial
-from typing import Any, Dict, List, Optional, Sequence, Type, Union
+from typing import AbstractSet, Any, Dict, List, Optional, Sequence, Type, Union
 
 from kedro.io.core import (
     AbstractDataSet,
@@ -500,6 +500,19 @@ class DataCatalog:
         """
         return list(self._data_sets.keys())
 
+    @property
+    def names_set(self) -> AbstractSet[str]:
+        """Read-only set of ``DataSet`` names registered in the catalog. Unlike
+        ``list()``, it is not copied on access and it reflects any data sets
+        added to the catalog afterwards.
+
+        Returns:
+            A set-like view of the names of the ``DataSet`` objects
+            registered in the current catalog object.
+
+        """
+        return self._data_sets.keys()
+
     def shallow_copy(self) -> "DataCatalog":
         """Returns a shallow copy of the current object.
 
@@ -531,3 +544,16 @@ class DataCatalog:
                 is allowed if the argument is not set.
         """
         self._data_sets[ds_name].set_remaining_loads(remaining_loads)
+
+    def set_all_remaining_loads(self, remaining_loads: Dict[str, int]):
+        """Set the maximum number of times each of the given datasets can be
+        loaded, in a single call. See ``set_remaining_loads``.
+
+        Args:
+            remaining_loads: A dictionary of dataset names and the maximum
+                number of times ``load`` method of each dataset is allowed
+                to be invoked.
+        """
+        data_sets = self._data_sets
+        for ds_name, num_loads in remaining_loads.items():
+            data_sets[ds_name].set_remaining_loads(num_loads)
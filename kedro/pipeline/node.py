@@ -39,7 +39,7 @@ from warnings import warn
 TRANSCODING_SEPARATOR = "@"
 
 
-class Node:
+class Node:  # pylint: disable=too-many-instance-attributes
     """``Node`` is an auxiliary class facilitating the operations required to
     run user-provided functions as part of Kedro pipelines.
     """
@@ -117,11 +117,17 @@ class Node:
         self._validate_inputs(func, inputs)
 
         self._func = func
-        self._inputs = inputs
-        self._outputs = outputs
+        # copy the containers so that later changes made by the caller do not
+        # affect the node's hash or how it is run
+        self._inputs = copy.copy(inputs)
+        self._outputs = copy.copy(outputs)
         self._name = name
         self._tags = set([] if tags is None else tags)
         self._decorators = decorators or []
+        # normalise the names once, ``inputs`` and ``outputs`` are read for
+        # every node whenever a pipeline is built or run
+        self._input_names = tuple(self._to_list(inputs))
+        self._output_names = tuple(self._to_list(outputs))
 
         self._validate_unique_outputs()
         self._validate_inputs_dif_than_outputs()
@@ -233,7 +239,7 @@ class Node:
             Node input names as a list.
 
         """
-        return self._to_list(self._inputs)
+        return list(self._input_names)
 
     @property
     def input_namespaces(self) -> List[str]:
@@ -246,7 +252,7 @@ class Node:
             ValueError: Raised if more than one transcoding separator
             is present in an input name.
         """
-        return [self.get_namespace(elem) for elem in self._to_list(self._inputs)]
+        return [self.get_namespace(elem) for elem in self._input_names]
 
     @property
     def outputs(self) -> List[str]:
@@ -257,7 +263,7 @@ class Node:
             Node output names as a list.
 
         """
-        return self._to_list(self._outputs)
+        return list(self._output_names)
 
     @property
     def output_namespaces(self) -> List[str]:
@@ -270,7 +276,7 @@ class Node:
             ValueError: Raised if more than one transcoding separator
             is present in an output name.
         """
-        return [self.get_namespace(elem) for elem in self._to_list(self._outputs)]
+        return [self.get_namespace(elem) for elem in self._output_names]
 
     @property
     def _decorated_func(self):
@@ -32,12 +32,10 @@ produced outputs and execution order.
 """
 import copy
 import json
-from collections import Counter, defaultdict
+from collections import defaultdict
+from functools import wraps
 from itertools import chain
-from typing import Callable, Dict, Iterable, List, Set, Union
-
-from toposort import CircularDependencyError as ToposortCircleError
-from toposort import toposort
+from typing import Callable, Dict, FrozenSet, Iterable, List, Set, Tuple, Union
 
 import kedro
 from kedro.pipeline.node import Node
@@ -51,7 +49,23 @@ class OutputNotUniqueError(Exception):
     pass
 
 
-class Pipeline:
+def _cached(method: Callable) -> Callable:
+    """Memoize the result of a ``Pipeline`` method taking no arguments.
+    Pipelines are immutable, so the result never needs to be invalidated.
+    A copy of the result is returned, so callers are free to modify it.
+    """
+
+    @wraps(method)
+    def _wrapper(self):
+        cache = self._cache  # pylint: disable=protected-access
+        if method.__name__ not in cache:
+            cache[method.__name__] = method(self)
+        return copy.copy(cache[method.__name__])
+
+    return _wrapper
+
+
+class Pipeline:  # pylint: disable=too-many-instance-attributes
     """A ``Pipeline`` defined as a collection of ``Node`` objects. This class
     treats nodes as part of a graph representation and provides inputs,
     outputs and execution order.
@@ -113,21 +127,62 @@ class Pipeline:
         if name:
             nodes = [n.tag([name]) for n in nodes]
         self._name = name
-        self._nodes_by_name = {node.name: node for node in nodes}
         _validate_unique_outputs(nodes)
+        self._index_nodes(nodes)
 
-        self._nodes_by_input = defaultdict(set)  # input: {nodes with input}
-        for node in nodes:
-            for input_ in node.input_namespaces:
-                self._nodes_by_input[input_].add(node)
+        # sort eagerly, so that circular dependencies fail on construction
+        self._topo_sorted_nodes = _topologically_sorted(self.node_dependencies)
 
+    def _index_nodes(self, nodes: List[Node]) -> None:
+        self._nodes_by_name = {node.name: node for node in nodes}
+
+        # resolve the namespaces of each node once, the rest uses these indices.
+        # Nodes consuming a data set with several transcodings repeat, readers
+        # of ``_nodes_by_input`` deduplicate into sets
+        self._nodes_by_input = defaultdict(list)  # input: [nodes with input]
         self._nodes_by_output = {}  # output: node
         for node in nodes:
+            for input_ in node.input_namespaces:
+                self._nodes_by_input[input_].append(node)
             for output in node.output_namespaces:
                 self._nodes_by_output[output] = node
 
+        # namespaces both produced and consumed by pipeline nodes
+        self._intermediates = self._nodes_by_input.keys() & self._nodes_by_output.keys()
+
+        self._successors = {node: set() for node in nodes}  # node: {children}
+        self._predecessors = {node: set() for node in nodes}  # node: {parents}
+        for namespace in self._intermediates:
+            parent = self._nodes_by_output[namespace]
+            for child in self._nodes_by_input[namespace]:
+                # a node converting one transcoding of a data set into
+                # another does not depend on itself
+                if child is not parent:
+                    self._successors[parent].add(child)
+                    self._predecessors[child].add(parent)
+
         self._nodes = nodes
-        self._topo_sorted_nodes = _topologically_sorted(self.node_dependencies)
+        self._topo_sorted_nodes = None  # sorted lazily by ``_sorted_groups``
+        self._cache = {}  # method name: result, populated by ``_cached``
+
+    @staticmethod
+    def _sub_pipeline(nodes: Iterable[Node]) -> "Pipeline":
+        """Create a new ``Pipeline`` from nodes already known to be valid
+        together, e.g. a subset of the nodes of an existing pipeline. Any
+        subset of a valid acyclic pipeline is valid and acyclic too, so
+        validation is skipped and sorting is deferred until first needed.
+        The result is a plain ``Pipeline`` even when called on a subclass,
+        whose ``__init__`` would not run here.
+        """
+        pipeline = Pipeline.__new__(Pipeline)
+        pipeline._name = None  # pylint: disable=protected-access
+        pipeline._index_nodes(list(nodes))  # pylint: disable=protected-access
+        return pipeline
+
+    def _sorted_groups(self) -> Tuple[FrozenSet[Node], ...]:
+        if self._topo_sorted_nodes is None:
+            self._topo_sorted_nodes = _topologically_sorted(self.node_dependencies)
+        return self._topo_sorted_nodes
 
     def __repr__(self):  # pragma: no cover
         reprs = [repr(node) for node in self.nodes]
@@ -136,8 +191,42 @@ class Pipeline:
     def __add__(self, other):
         if not isinstance(other, Pipeline):
             return NotImplemented
-        return Pipeline(set(self.nodes + other.nodes))
+        # pylint: disable=protected-access
+        nodes = set(self._nodes) | set(other._nodes)
+        if self._conflicts_with(other):
+            # fully validate the nodes to report the conflict
+            return Pipeline(nodes)
+
+        pipeline = self._sub_pipeline(nodes)
+        # both pipelines are acyclic, but their combination may not be
+        pipeline._sorted_groups()
+        return pipeline
+
+    def _conflicts_with(self, other: "Pipeline") -> bool:
+        """Check whether combining two valid pipelines would break any of the
+        validation rules of ``Pipeline``. Each pipeline is valid on its own, so
+        only the names, outputs and data sets they share need checking.
+        """
+        # pylint: disable=protected-access
+        names = self._nodes_by_name.keys() & other._nodes_by_name.keys()
+        if any(self._nodes_by_name[n] != other._nodes_by_name[n] for n in names):
+            return True
+
+        outputs = self._nodes_by_output.keys() & other._nodes_by_output.keys()
+        if any(self._nodes_by_output[o] != other._nodes_by_output[o] for o in outputs):
+            return True
+
+        return not (
+            self._transcoded_namespaces().isdisjoint(other.data_sets())
+            and other._transcoded_namespaces().isdisjoint(self.data_sets())
+        )
 
+    @_cached
+    def _transcoded_namespaces(self) -> Set[str]:
+        data_sets = self.data_sets()
+        return {Node.get_namespace(ds) for ds in data_sets} - data_sets
+
+    @_cached
     def all_inputs(self) -> Set[str]:
         """All inputs for all nodes in the pipeline.
 
@@ -145,8 +234,9 @@ class Pipeline:
             All node input names as a Set.
 
         """
-        return set.union(set(), *[node.inputs for node in self.nodes])
+        return set(chain.from_iterable(node.inputs for node in self._nodes))
 
+    @_cached
     def all_outputs(self) -> Set[str]:
         """All outputs of all nodes in the pipeline.
 
@@ -154,14 +244,12 @@ class Pipeline:
             All node outputs.
 
         """
-        return set.union(set(), *[node.outputs for node in self.nodes])
+        return set(chain.from_iterable(node.outputs for node in self._nodes))
 
     def _remove_intermediates(self, datasets: Set[str]) -> Set[str]:
-        intermediate = {Node.get_namespace(i) for i in self.all_inputs()} & {
-            Node.get_namespace(o) for o in self.all_outputs()
-        }
-        return {d for d in datasets if Node.get_namespace(d) not in intermediate}
+        return {d for d in datasets if Node.get_namespace(d) not in self._intermediates}
 
+    @_cached
     def inputs(self) -> Set[str]:
         """The names of free inputs that must be provided at runtime so that
         the pipeline is runnable. Does not include intermediate inputs which
@@ -174,6 +262,7 @@ class Pipeline:
         """
         return self._remove_intermediates(self.all_inputs())
 
+    @_cached
     def outputs(self) -> Set[str]:
         """The names of outputs produced when the whole pipeline is run.
         Does not include intermediate outputs that are consumed by
@@ -185,6 +274,7 @@ class Pipeline:
         """
         return self._remove_intermediates(self.all_outputs())
 
+    @_cached
     def data_sets(self) -> Set[str]:
         """The names of all data sets used by the ``Pipeline``,
         including inputs and outputs.
@@ -238,25 +328,23 @@ class Pipeline:
             """
             return ", ".join(sorted(set_of_strings)) if set_of_strings else "None"
 
-        nodes_as_string = "\n".join(
-            node.name if names_only else str(node) for node in self.nodes
-        )
-
-        str_representation = (
-            "#### Pipeline execution order ####\n"
-            "Name: {0}\n"
-            "Inputs: {1}\n\n"
-            "{2}\n\n"
-            "Outputs: {3}\n"
-            "##################################"
-        )
+        # build all lines first and join once, rather than joining the nodes
+        # and then copying the result again into the surrounding template
+        lines = [
+            "#### Pipeline execution order ####",
+            "Name: {}".format(self._name),
+            "Inputs: {}".format(set_to_string(self.inputs())),
+            "",
+        ]
+        nodes = [node.name if names_only else str(node) for node in self.nodes]
+        lines.extend(nodes or [""])
+        lines += [
+            "",
+            "Outputs: {}".format(set_to_string(self.outputs())),
+            "##################################",
+        ]
 
-        return str_representation.format(
-            self._name,
-            set_to_string(self.inputs()),
-            nodes_as_string,
-            set_to_string(self.outputs()),
-        )
+        return "\n".join(lines)
 
     @property
     def name(self) -> str:
@@ -277,15 +365,10 @@ class Pipeline:
             Dictionary where keys are nodes and values are sets made up of
             their parent nodes. Independent nodes have this as empty sets.
         """
-        dependencies = {node: set() for node in self._nodes}
-        for parent in self._nodes:
-            for output in parent.output_namespaces:
-                for child in self._nodes_by_input[output]:
-                    dependencies[child].add(parent)
-
-        return dependencies
+        return {node: set(parents) for node, parents in self._predecessors.items()}
 
     @property
+    @_cached
     def nodes(self) -> List[Node]:
         """Return a list of the pipeline nodes in topological order, i.e. if
         node A needs to be run before node B, it will appear earlier in the
@@ -295,19 +378,20 @@ class Pipeline:
             The list of all pipeline nodes in topological order.
 
         """
-        return list(chain.from_iterable(self._topo_sorted_nodes))
+        return list(chain.from_iterable(self._sorted_groups()))
 
     @property
-    def grouped_nodes(self) -> List[Set[Node]]:
-        """Return a list of the pipeline nodes in topologically ordered groups,
+    def grouped_nodes(self) -> Tuple[FrozenSet[Node], ...]:
+        """Return a tuple of the pipeline nodes in topologically ordered groups,
         i.e. if node A needs to be run before node B, it will appear in an
         earlier group.
 
         Returns:
-            The pipeline nodes in topologically ordered groups.
+            The pipeline nodes in topologically ordered groups, as an
+            immutable tuple of frozensets.
 
         """
-        return copy.copy(self._topo_sorted_nodes)
+        return self._sorted_groups()
 
     def only_nodes(self, *node_names: str) -> "Pipeline":
         """Create a new ``Pipeline`` which will contain only the specified
@@ -333,7 +417,8 @@ class Pipeline:
             )
 
         nodes = [self._nodes_by_name[name] for name in node_names]
-        return Pipeline(nodes)
+        _validate_duplicate_nodes(nodes)
+        return self._sub_pipeline(nodes)
 
     def only_nodes_with_inputs(self, *inputs: str) -> "Pipeline":
         """Create a new ``Pipeline`` object with the nodes which depend
@@ -365,7 +450,7 @@ class Pipeline:
             chain.from_iterable(self._nodes_by_input[input_] for input_ in starting)
         )
 
-        return Pipeline(nodes)
+        return self._sub_pipeline(nodes)
 
     def from_inputs(self, *inputs: str) -> "Pipeline":
         """Create a new ``Pipeline`` object with the nodes which depend
@@ -394,20 +479,22 @@ class Pipeline:
                 "Pipeline does not contain data_sets named {}".format(missing)
             )
 
+        # start from the nodes reading any transcoding of the inputs, the same
+        # way the traversal follows transcoded data sets to the children
         all_nodes = set()
-        while True:
-            nodes = set(
-                chain.from_iterable(self._nodes_by_input[input_] for input_ in starting)
+        nodes = set(
+            chain.from_iterable(
+                self._nodes_by_input[Node.get_namespace(input_)] for input_ in starting
             )
-
-            outputs = set(chain.from_iterable(node.outputs for node in nodes))
-
-            starting = outputs
+        )
+        while nodes:
             all_nodes |= nodes
-            if not nodes:
-                break
+            children = set()
+            for parent in nodes:
+                children.update(self._successors[parent])
+            nodes = children - all_nodes
 
-        return Pipeline(all_nodes)
+        return self._sub_pipeline(all_nodes)
 
     def only_nodes_with_outputs(self, *outputs: str) -> "Pipeline":
         """Create a new ``Pipeline`` object with the nodes which are directly
@@ -440,7 +527,7 @@ class Pipeline:
             if output in self._nodes_by_output
         }
 
-        return Pipeline(nodes)
+        return self._sub_pipeline(nodes)
 
     def to_outputs(self, *outputs: str) -> "Pipeline":
         """Create a new ``Pipeline`` object with the nodes which are directly
@@ -468,22 +555,23 @@ class Pipeline:
                 "Pipeline does not contain data_sets named {}".format(missing)
             )
 
+        # start from the nodes writing any transcoding of the outputs, the
+        # same way the traversal follows transcoded data sets to the parents
         all_nodes = set()
-        while True:
-            nodes = {
-                self._nodes_by_output[output]
-                for output in starting
-                if output in self._nodes_by_output
-            }
-
-            inputs = set(chain.from_iterable(node.inputs for node in nodes))
-
-            starting = inputs
+        namespaces = {Node.get_namespace(output) for output in starting}
+        nodes = {
+            self._nodes_by_output[namespace]
+            for namespace in namespaces
+            if namespace in self._nodes_by_output
+        }
+        while nodes:
             all_nodes |= nodes
-            if not nodes:
-                break
+            parents = set()
+            for child in nodes:
+                parents.update(self._predecessors[child])
+            nodes = parents - all_nodes
 
-        return Pipeline(all_nodes)
+        return self._sub_pipeline(all_nodes)
 
     def from_nodes(self, *node_names: str) -> "Pipeline":
         """Create a new ``Pipeline`` object with the nodes which depend
@@ -503,8 +591,9 @@ class Pipeline:
         """
 
         res = self.only_nodes(*node_names)
-        res += self.from_inputs(*res.all_outputs())
-        return res
+        descendants = self.from_inputs(*res.all_outputs())
+        # pylint: disable=protected-access
+        return self._sub_pipeline(set(res._nodes) | set(descendants._nodes))
 
     def to_nodes(self, *node_names: str) -> "Pipeline":
         """Create a new ``Pipeline`` object with the nodes required directly
@@ -524,8 +613,9 @@ class Pipeline:
         """
 
         res = self.only_nodes(*node_names)
-        res += self.to_outputs(*res.all_inputs())
-        return res
+        ancestors = self.to_outputs(*res.all_inputs())
+        # pylint: disable=protected-access
+        return self._sub_pipeline(set(res._nodes) | set(ancestors._nodes))
 
     def only_nodes_with_tags(self, *tags: str) -> "Pipeline":
         """Create a new ``Pipeline`` object with the nodes which contain *any*
@@ -541,8 +631,8 @@ class Pipeline:
                 of the tags provided are being copied.
         """
         tags = set(tags)
-        nodes = [node for node in self.nodes if tags & node.tags]
-        return Pipeline(nodes)
+        nodes = [node for node in self._nodes if not tags.isdisjoint(node.tags)]
+        return self._sub_pipeline(nodes)
 
     def decorate(self, *decorators: Callable) -> "Pipeline":
         """Create a new ``Pipeline`` by applying the provided decorators to
@@ -559,9 +649,10 @@ class Pipeline:
             provided decorators.
 
         """
-        nodes = [node.decorate(*decorators) for node in self.nodes]
+        nodes = [node.decorate(*decorators) for node in self._nodes]
         return Pipeline(nodes)
 
+    @_cached
     def to_json(self):
         """Return a json representation of the pipeline."""
         transformed = [
@@ -590,8 +681,15 @@ def _validate_no_node_list(nodes: Iterable[Node]):
 
 
 def _validate_duplicate_nodes(nodes: List[Node]):
-    names = [node.name for node in nodes]
-    duplicate = [key for key, value in Counter(names).items() if value > 1]
+    seen = set()
+    duplicate = []
+    for node in nodes:
+        name = node.name
+        if name not in seen:
+            seen.add(name)
+        elif name not in duplicate:
+            duplicate.append(name)
+
     if duplicate:
         raise ValueError(
             "Pipeline nodes must have unique names. The "
@@ -602,15 +700,20 @@ def _validate_duplicate_nodes(nodes: List[Node]):
 
 
 def _validate_unique_outputs(nodes: List[Node]) -> None:
-    outputs_list = list(chain.from_iterable(node.output_namespaces for node in nodes))
-    counter_list = Counter(outputs_list)
-    counter_set = Counter(set(outputs_list))
-    diff = counter_list - counter_set
-    if diff:
+    seen = set()
+    duplicate = set()
+    for node in nodes:
+        for output in node.output_namespaces:
+            if output in seen:
+                duplicate.add(output)
+            else:
+                seen.add(output)
+
+    if duplicate:
         raise OutputNotUniqueError(
             "Output(s) {} are returned by "
             "more than one nodes. Node "
-            "outputs must be unique.".format(sorted(diff.keys()))
+            "outputs must be unique.".format(sorted(duplicate))
         )
 
 
@@ -618,18 +721,18 @@ def _validate_namespaced_inputs_outputs(nodes: List[Node]) -> None:
     """Users should not be allowed to refer to a dataset without
     the separator if it is referenced later on in the pipeline.
     """
-    all_inputs_outputs = set(
-        chain(
-            chain.from_iterable(node.inputs for node in nodes),
-            chain.from_iterable(node.outputs for node in nodes),
-        )
-    )
-
-    invalid = set()
-    for dataset_name in all_inputs_outputs:
-        namespace = Node.get_namespace(dataset_name)
-        if namespace != dataset_name and namespace in all_inputs_outputs:
-            invalid.add(namespace)
+    all_inputs_outputs = set()
+    namespaces = set()  # namespaces of transcoded data sets
+    for node in nodes:
+        for dataset_name in chain(node.inputs, node.outputs):
+            if dataset_name in all_inputs_outputs:
+                continue
+            all_inputs_outputs.add(dataset_name)
+            namespace = Node.get_namespace(dataset_name)
+            if namespace != dataset_name:
+                namespaces.add(namespace)
+
+    invalid = namespaces & all_inputs_outputs
 
     if invalid:
         raise ValueError(
@@ -640,7 +743,7 @@ def _validate_namespaced_inputs_outputs(nodes: List[Node]) -> None:
         )
 
 
-def _topologically_sorted(node_dependencies) -> List[Set[Node]]:
+def _topologically_sorted(node_dependencies) -> Tuple[FrozenSet[Node], ...]:
     """Topologically group and sort (order) nodes such that no node depends on
     a node that appears in the same or a later group.
 
@@ -649,25 +752,39 @@ def _topologically_sorted(node_dependencies) -> List[Set[Node]]:
             provided nodes.
 
     Returns:
-        The list of node sets in order of execution. First set is nodes that should
+        The tuple of node sets in order of execution. First set is nodes that should
         be executed first (no dependencies), second set are nodes that should be
         executed on the second step, etc.
     """
-
-    def _circle_error_message(error_data: Dict[str, str]) -> str:
-        """Error messages provided by the toposort library will
-        refer to indices that are used as an intermediate step.
-        This method can be used to replace that message with
-        one that refers to the nodes' string representations.
-        """
-        circular = [str(node) for node in error_data.keys()]
-        return "Circular dependencies exist among these items: {}".format(circular)
-
-    try:
-        return list(toposort(node_dependencies))
-    except ToposortCircleError as error:
-        message = _circle_error_message(error.data)
-        raise CircularDependencyError(message) from error
+    # work on integer ids, hashing nodes is far more expensive than indexing
+    nodes = list(node_dependencies)
+    node_ids = {node: node_id for node_id, node in enumerate(nodes)}
+    children = [[] for _ in nodes]  # node id: [child node ids]
+    num_parents = [0] * len(nodes)  # node id: number of parents not yet sorted
+    for node, parents in node_dependencies.items():
+        node_id = node_ids[node]
+        num_parents[node_id] = len(parents)
+        for parent in parents:
+            children[node_ids[parent]].append(node_id)
+
+    result = []
+    ready = [node_id for node_id, count in enumerate(num_parents) if not count]
+    while ready:
+        result.append(frozenset(nodes[node_id] for node_id in ready))
+        next_ready = []
+        for node_id in ready:
+            for child_id in children[node_id]:
+                num_parents[child_id] -= 1
+                if not num_parents[child_id]:
+                    next_ready.append(child_id)
+        ready = next_ready
+
+    if sum(map(len, result)) != len(nodes):
+        circular = [str(nodes[i]) for i, count in enumerate(num_parents) if count]
+        raise CircularDependencyError(
+            "Circular dependencies exist among these items: {}".format(circular)
+        )
+    return tuple(result)
 
 
 class CircularDependencyError(Exception):
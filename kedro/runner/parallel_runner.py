@@ -26,19 +26,22 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 """``ParallelRunner`` is an ``AbstractRunner`` implementation. It can
-be used to run the ``Pipeline`` in parallel groups formed by toposort.
+be used to run the ``Pipeline`` in parallel, submitting every node as soon
+as all the nodes it depends on have completed.
 """
 
+import os
 from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from heapq import heapify, heappop, heappush
 from multiprocessing.managers import BaseManager, BaseProxy
 from multiprocessing.reduction import ForkingPickler
 from pickle import PicklingError
-from typing import Iterable
+from typing import Dict, Iterable, Set, Tuple
 
 from kedro.io import AbstractDataSet, DataCatalog, MemoryDataSet
 from kedro.pipeline import Pipeline
 from kedro.pipeline.node import Node
-from kedro.runner.runner import AbstractRunner, run_node
+from kedro.runner.runner import AbstractRunner, narrow_catalog, run_node
 
 
 class ParallelRunnerManager(BaseManager):
@@ -54,12 +57,29 @@ ParallelRunnerManager.register("MemoryDataSet", MemoryDataSet)
 
 class ParallelRunner(AbstractRunner):
     """``ParallelRunner`` is an ``AbstractRunner`` implementation. It can
-    be used to run the ``Pipeline`` in parallel groups formed by toposort.
+    be used to run the ``Pipeline`` in parallel, submitting every node as
+    soon as all the nodes it depends on have completed. When more nodes are
+    ready than there are workers, the nodes heading the longest chains of
+    dependent nodes are submitted first, then those with most children.
+    Every node runs in a worker process, so CPU-bound nodes are not held
+    back by the GIL, and only receives the data sets it loads or saves.
     """
 
-    def __init__(self):
+    def __init__(self, max_workers: int = None):
         """Instantiates the runner by creating a Manager.
+
+        Args:
+            max_workers: Number of worker processes to spawn. Defaults to
+                the number of CPUs on the machine.
+
+        Raises:
+            ValueError: When ``max_workers`` is not a positive number.
         """
+        if max_workers is not None and max_workers <= 0:
+            raise ValueError(
+                "max_workers should be positive, got {}".format(max_workers)
+            )
+        self._max_workers = max_workers or os.cpu_count() or 1
         self._manager = ParallelRunnerManager()
         self._manager.start()
 
@@ -124,9 +144,10 @@ class ParallelRunner(AbstractRunner):
             )
 
         memory_data_sets = []
+        all_outputs = pipeline.all_outputs()
         for name, data_set in data_sets.items():
             if (
-                name in pipeline.all_outputs()
+                name in all_outputs
                 and isinstance(data_set, MemoryDataSet)
                 and not isinstance(data_set, BaseProxy)
             ):
@@ -155,20 +176,59 @@ class ParallelRunner(AbstractRunner):
         self._validate_catalog(catalog, pipeline)
         self._validate_nodes(pipeline.nodes)
 
-        node_dependencies = pipeline.node_dependencies
-        todo_nodes = node_dependencies.keys()
-        done_nodes = set()
+        # count the unfinished parents of each node, so that a child can be
+        # submitted as soon as its last parent completes, without rescanning
+        # all remaining nodes after every completion
+        children, num_parents = _children_and_num_parents(pipeline)
+        priorities = _node_priorities(pipeline, children)
+        ready = [priorities[node] for node, count in num_parents.items() if not count]
+        heapify(ready)
         futures = set()
-        done = None
-        with ProcessPoolExecutor() as pool:
+        with ProcessPoolExecutor(max_workers=self._max_workers) as pool:
             while True:
-                ready = {n for n in todo_nodes if node_dependencies[n] <= done_nodes}
-                todo_nodes -= ready
-                for node in ready:
-                    futures.add(pool.submit(run_node, node, catalog))
+                while ready and len(futures) < self._max_workers:
+                    node = heappop(ready)[-1]
+                    node_catalog = _node_catalog(catalog, node)
+                    futures.add(pool.submit(run_node, node, node_catalog))
                 if not futures:
-                    assert not todo_nodes, (todo_nodes, done_nodes, ready, done)
+                    assert not any(num_parents.values()), num_parents
                     break
                 done, futures = wait(futures, return_when=FIRST_COMPLETED)
                 for future in done:
-                    done_nodes.add(future.result())
+                    for child in children[future.result()]:
+                        num_parents[child] -= 1
+                        if not num_parents[child]:
+                            heappush(ready, priorities[child])
+
+
+def _children_and_num_parents(
+    pipeline: Pipeline
+) -> Tuple[Dict[Node, Set[Node]], Dict[Node, int]]:
+    node_dependencies = pipeline.node_dependencies
+    children = {node: set() for node in node_dependencies}
+    num_parents = {}
+    for node, parents in node_dependencies.items():
+        num_parents[node] = len(parents)
+        for parent in parents:
+            children[parent].add(node)
+    return children, num_parents
+
+
+def _node_catalog(catalog: DataCatalog, node: Node) -> DataCatalog:
+    """Narrow down the catalog to the data sets that the node loads or saves,
+    so that only those are pickled and sent to the worker process.
+    """
+    return narrow_catalog(catalog, set(node.inputs) | set(node.outputs))
+
+
+def _node_priorities(
+    pipeline: Pipeline, children: Dict[Node, Set[Node]]
+) -> Dict[Node, Tuple[int, int, Node]]:
+    """Rank the nodes for submission, lowest first: nodes heading the longest
+    chain of dependent nodes come first, ties are broken by the number of
+    children, so that the critical path of the pipeline starts early.
+    """
+    depth = {}
+    for node in reversed(pipeline.nodes):
+        depth[node] = 1 + max((depth[child] for child in children[node]), default=0)
+    return {node: (-depth[node], -len(children[node]), node) for node in depth}
@@ -31,7 +31,10 @@ implementations.
 
 import logging
 from abc import ABC, abstractmethod
-from typing import Any, Dict
+from collections import Counter
+from concurrent.futures import Future
+from itertools import chain
+from typing import AbstractSet, Any, Dict, Iterable, Iterator, Mapping
 
 from kedro.io import AbstractDataSet, DataCatalog
 from kedro.pipeline import Pipeline
@@ -47,7 +50,7 @@ class AbstractRunner(ABC):
     def _logger(self):
         return logging.getLogger(self.__module__)
 
-    def run(self, pipeline: Pipeline, catalog: DataCatalog) -> Dict[str, Any]:
+    def run(self, pipeline: Pipeline, catalog: DataCatalog) -> Mapping[str, Any]:
         """Run the ``Pipeline`` using the ``DataSet``s provided by ``catalog``
         and save results back to the same objects.
 
@@ -60,38 +63,48 @@ class AbstractRunner(ABC):
 
         Returns:
             Any node outputs that cannot be processed by the ``DataCatalog``.
-            These are returned in a dictionary, where the keys are defined
-            by the node outputs.
+            These are returned in a read-only mapping, where the keys are
+            defined by the node outputs. Each output is loaded the first
+            time it is accessed.
 
         """
 
-        catalog = catalog.shallow_copy()
+        registered_ds = catalog.names_set
 
-        unsatisfied = pipeline.inputs() - set(catalog.list())
-        if unsatisfied:
+        # check the inputs first, without building the set of unsatisfied ones
+        # unless the check fails, as the inputs are satisfied in most runs
+        if not registered_ds >= pipeline.inputs():
+            unsatisfied = pipeline.inputs() - registered_ds
             raise ValueError(
                 "Pipeline input(s) {} not found in the "
                 "DataCatalog".format(unsatisfied)
             )
 
-        free_outputs = pipeline.outputs() - set(catalog.list())
-        unregistered_ds = pipeline.data_sets() - set(catalog.list())
-        for ds_name in unregistered_ds:
-            catalog.add(ds_name, self.create_default_data_set(ds_name))
+        free_outputs = pipeline.outputs() - registered_ds
+        unregistered_ds = pipeline.data_sets() - registered_ds
+        if unregistered_ds:
+            # copy the catalog only when it needs default data sets, so that
+            # they are not registered in the catalog passed in
+            catalog = catalog.shallow_copy()
+            for ds_name in unregistered_ds:
+                catalog.add(ds_name, self.create_default_data_set(ds_name))
 
-        for ds_name in pipeline.all_inputs():
-            num_loads = len(pipeline.only_nodes_with_inputs(ds_name).nodes)
-            catalog.set_remaining_loads(ds_name, num_loads)
+        # the counted names are exactly the pipeline's inputs, so there is no
+        # need to walk the nodes again through ``pipeline.all_inputs()``
+        load_counts = Counter(chain.from_iterable(n.inputs for n in pipeline.nodes))
+        catalog.set_all_remaining_loads(load_counts)
 
         self._run(pipeline, catalog)
 
         self._logger.info("Pipeline execution completed successfully.")
 
-        return {ds_name: catalog.load(ds_name) for ds_name in free_outputs}
+        # hold on to the free output data sets only, so that the data sets of
+        # the intermediate outputs can be released once the run completes
+        return _LazyOutputs(free_outputs, narrow_catalog(catalog, free_outputs))
 
     def run_only_missing(
         self, pipeline: Pipeline, catalog: DataCatalog
-    ) -> Dict[str, Any]:
+    ) -> Mapping[str, Any]:
         """Run only the missing outputs from the ``Pipeline`` using the
         ``DataSet``s provided by ``catalog`` and save results back to the same
         objects.
@@ -104,12 +117,14 @@ class AbstractRunner(ABC):
 
         Returns:
             Any node outputs that cannot be processed by the ``DataCatalog``.
-            These are returned in a dictionary, where the keys are defined
-            by the node outputs.
+            These are returned in a read-only mapping, where the keys are
+            defined by the node outputs. Each output is loaded the first
+            time it is accessed.
 
         """
-        free_outputs = pipeline.outputs() - set(catalog.list())
-        missing = {ds for ds in catalog.list() if not catalog.exists(ds)}
+        registered_ds = catalog.names_set
+        free_outputs = pipeline.outputs() - registered_ds
+        missing = {ds for ds in registered_ds if not catalog.exists(ds)}
         to_build = free_outputs | missing
         to_rerun = pipeline.only_nodes_with_outputs(*to_build) + pipeline.from_inputs(
             *to_build
@@ -117,10 +132,11 @@ class AbstractRunner(ABC):
 
         # we also need any memory data sets that feed into that
         # including chains of memory data sets
-        memory_sets = pipeline.data_sets() - set(catalog.list())
-        output_to_memory = pipeline.only_nodes_with_outputs(*memory_sets)
+        memory_sets = pipeline.data_sets() - registered_ds
         input_from_memory = to_rerun.inputs() & memory_sets
-        to_rerun += output_to_memory.to_outputs(*input_from_memory)
+        if input_from_memory:
+            output_to_memory = pipeline.only_nodes_with_outputs(*memory_sets)
+            to_rerun += output_to_memory.to_outputs(*input_from_memory)
 
         return self.run(to_rerun, catalog)
 
@@ -128,6 +144,9 @@ class AbstractRunner(ABC):
     def _run(self, pipeline: Pipeline, catalog: DataCatalog) -> None:
         """The abstract interface for running pipelines, assuming that the
         inputs have already been checked and normalized by run().
+        ``pipeline.nodes`` is topologically sorted once and cached by the
+        ``Pipeline``, so implementations should rely on it, or on
+        ``pipeline.node_dependencies``, rather than sorting nodes again.
 
         Args:
             pipeline: The ``Pipeline`` to run.
@@ -151,19 +170,84 @@ class AbstractRunner(ABC):
         pass
 
 
-def run_node(node: Node, catalog: DataCatalog) -> Node:
+def narrow_catalog(catalog: DataCatalog, names: Iterable[str]) -> DataCatalog:
+    """Create a ``DataCatalog`` with only the given data sets of ``catalog``,
+    along with their transformers.
+
+    Args:
+        catalog: The ``DataCatalog`` to narrow down.
+        names: The names of the data sets to keep.
+
+    Returns:
+        A new ``DataCatalog`` sharing the given data sets with ``catalog``.
+
+    """
+    # pylint: disable=protected-access
+    return DataCatalog(
+        data_sets={name: catalog._data_sets[name] for name in names},
+        transformers={name: catalog._transformers[name] for name in names},
+        default_transformers=catalog._default_transformers,
+    )
+
+
+class _LazyOutputs(Mapping[str, Any]):
+    """Read-only mapping of the free outputs of a run, which loads every
+    output from the catalog on first access and keeps it afterwards.
+    """
+
+    def __init__(self, names: AbstractSet[str], catalog: DataCatalog):
+        # ``run()`` hands over a set it does not use afterwards, so keep it
+        # as it is rather than copying it
+        self._names = names
+        self._catalog = catalog
+        self._loaded = {}  # type: Dict[str, Any]
+
+    def __getitem__(self, name: str) -> Any:
+        if name not in self._loaded:
+            if name not in self._names:
+                raise KeyError(name)
+            self._loaded[name] = self._catalog.load(name)
+        return self._loaded[name]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._names)
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def __repr__(self):
+        return repr(dict(self))
+
+
+def run_node(
+    node: Node, catalog: DataCatalog, prefetched: Dict[str, Future] = None
+) -> Node:
     """Run a single `Node` with inputs from and outputs to the `catalog`.
 
     Args:
         node: The ``Node`` to run.
         catalog: A ``DataCatalog`` containing the node's inputs and outputs.
+        prefetched: Futures of inputs already being loaded from the
+            ``catalog``, keyed by data set name. Inputs missing from it are
+            loaded synchronously.
 
     Returns:
         The node argument.
 
     """
-    inputs = {name: catalog.load(name) for name in node.inputs}
+    load = catalog.load
+    if prefetched:
+        prefetched = dict(prefetched)
+        inputs = {
+            name: prefetched.pop(name).result() if name in prefetched else load(name)
+            for name in node.inputs
+        }
+    else:
+        inputs = {name: load(name) for name in node.inputs}
+
     outputs = node.run(inputs)
+
+    save = catalog.save
     for name, data in outputs.items():
-        catalog.save(name, data)
+        save(name, data)
     return node
@@ -30,8 +30,12 @@ used to run the ``Pipeline`` in a sequential manner using a topological sort
 of provided nodes.
 """
 
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, List
+
 from kedro.io import AbstractDataSet, DataCatalog, MemoryDataSet
 from kedro.pipeline import Pipeline
+from kedro.pipeline.node import Node
 from kedro.runner.runner import AbstractRunner, run_node
 
 
@@ -41,6 +45,17 @@ class SequentialRunner(AbstractRunner):
     topological sort of provided nodes.
     """
 
+    def __init__(self, prefetch: bool = False):
+        """Instantiates the runner.
+
+        Args:
+            prefetch: Whether to load the inputs of the next node in a
+                background thread while the current node is running.
+                Inputs that the current node produces or reads are loaded
+                once it completes.
+        """
+        self._prefetch = prefetch
+
     def create_default_data_set(self, ds_name: str) -> AbstractDataSet:
         """Factory method for creating the default data set for the runner.
 
@@ -62,9 +77,39 @@ class SequentialRunner(AbstractRunner):
             catalog: The ``DataCatalog`` from which to fetch data.
 
         """
-        nodes = pipeline.nodes
+        if self._prefetch:
+            with ThreadPoolExecutor(max_workers=1) as pool:
+                self._run_nodes(pipeline.nodes, catalog, pool)
+        else:
+            self._run_nodes(pipeline.nodes, catalog)
+
+    def _run_nodes(
+        self, nodes: List[Node], catalog: DataCatalog, pool: ThreadPoolExecutor = None
+    ) -> None:
+        logger = self._logger  # look the logger up once, not for every node
+        prefetched = {}  # type: Dict[str, Future]
         for exec_index, node in enumerate(nodes):
-            run_node(node, catalog)
-            self._logger.info(
-                "Completed %d out of %d tasks", exec_index + 1, len(nodes)
-            )
+            next_prefetched = {}
+            if pool and exec_index + 1 < len(nodes):
+                next_prefetched = _prefetch_inputs(
+                    pool, catalog, nodes[exec_index + 1], node
+                )
+            run_node(node, catalog, prefetched)
+            prefetched = next_prefetched
+            logger.info("Completed %d out of %d tasks", exec_index + 1, len(nodes))
+
+
+def _prefetch_inputs(
+    pool: ThreadPoolExecutor, catalog: DataCatalog, node: Node, running: Node
+) -> Dict[str, Future]:
+    """Start loading the inputs of ``node`` that ``running``, the node
+    currently being run, neither produces nor reads, including through
+    transcoding. Those are loaded once ``running`` completes, so that no data
+    set is used from both threads at the same time.
+    """
+    in_use = set(running.input_namespaces) | set(running.output_namespaces)
+    return {
+        name: pool.submit(catalog.load, name)
+        for name in set(node.inputs)
+        if Node.get_namespace(name) not in in_use
+    }
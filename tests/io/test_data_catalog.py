@@ -217,6 +217,22 @@ class TestDataCatalog:
         assert "abc" in entries
         assert "xyz" in entries
 
+    def test_names_set(self, data_catalog, data_set):
+        """The names set reflects data sets added after it was taken"""
+        names = data_catalog.names_set
+        assert names == {"test"}
+        data_catalog.add("added", data_set)
+        assert names == {"test", "added"}
+
+    def test_set_all_remaining_loads(self, memory_catalog):
+        memory_catalog.set_all_remaining_loads({"ds1": 1, "ds2": 2})
+        memory_catalog.load("ds1")
+        memory_catalog.load("ds2")
+        memory_catalog.load("ds2")
+        for ds_name in ["ds1", "ds2"]:
+            with pytest.raises(DataSetError, match="was cleared"):
+                memory_catalog.load(ds_name)
+
     def test_eq(self, multi_catalog, data_catalog):
         assert multi_catalog == multi_catalog  # pylint: disable=comparison-with-itself
         assert multi_catalog == multi_catalog.shallow_copy()
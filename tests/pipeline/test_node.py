@@ -140,6 +140,24 @@ class TestValidNode:
         )
         assert dummy_node.outputs == ["output2", "output1", "last node"]
 
+    def test_inputs_outputs_copied(self):
+        inputs = ["input1", "input2"]
+        outputs = ["output1"]
+
+        def concat_to_list(input1, input2):
+            return [input1 + input2]
+
+        dummy_node = node(concat_to_list, inputs, outputs)
+        node_hash = hash(dummy_node)
+        inputs.append("input3")
+        outputs.append("output2")
+        dummy_node.inputs.append("input4")
+        dummy_node.outputs.append("output2")
+        assert dummy_node.inputs == ["input1", "input2"]
+        assert dummy_node.outputs == ["output1"]
+        assert hash(dummy_node) == node_hash
+        assert dummy_node.run({"input1": "a", "input2": "b"}) == {"output1": "ab"}
+
     def test_input_namespaces(self):
         dummy_node = node(
             triconcat, ["input@formA", "input@formB", "another node"], "output"
@@ -26,6 +26,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import json
 from functools import wraps
 from itertools import chain
 from typing import Callable
@@ -303,6 +304,34 @@ class TestValidPipeline:
 
         assert set(pipeline.nodes) == set(nodes)
 
+    def test_node_converting_transcoding(self):
+        """A node reading and writing transcodings of the same data set does
+        not depend on itself."""
+        converter = node(identity, "A@pandas", "A@spark", name="converter")
+        pipeline = Pipeline([converter])
+
+        assert pipeline.nodes == [converter]
+        assert pipeline.node_dependencies == {converter: set()}
+
+    def test_filtered_subclass_is_pipeline(self, str_node_inputs_list):
+        """Filtering a ``Pipeline`` subclass returns a plain ``Pipeline``, as
+        the subclass ``__init__`` is not run on the result."""
+
+        class CustomPipeline(Pipeline):
+            def __init__(self, nodes):
+                super().__init__(nodes)
+                self.custom = True
+
+        pipeline = CustomPipeline(str_node_inputs_list["nodes"])
+        sub_pipelines = [
+            pipeline.only_nodes_with_tags("tag"),
+            pipeline.from_inputs("input1"),
+            pipeline + pipeline,
+        ]
+        # pylint: disable=unidiomatic-typecheck
+        for sub_pipeline in sub_pipelines:
+            assert type(sub_pipeline) is Pipeline
+
     def test_grouped_nodes(self, input_data):
         """Check if grouped_nodes func groups the nodes correctly"""
         nodes_input = input_data["nodes"]
@@ -341,6 +370,18 @@ class TestValidPipeline:
 
         assert pipeline.outputs() == set(outputs)
 
+    def test_all_inputs_outputs_copied(self, str_node_inputs_list):
+        """Modifying the returned sets does not change the pipeline"""
+        pipeline = Pipeline(str_node_inputs_list["nodes"])
+        all_inputs = pipeline.all_inputs()
+        all_outputs = pipeline.all_outputs()
+
+        pipeline.all_inputs().clear()
+        pipeline.all_outputs().clear()
+
+        assert all_inputs and pipeline.all_inputs() == all_inputs
+        assert all_outputs and pipeline.all_outputs() == all_outputs
+
     def test_combine(self):
         pipeline1 = Pipeline([node(biconcat, ["input", "input1"], "output1", name="a")])
         pipeline2 = Pipeline([node(biconcat, ["input", "input2"], "output2", name="b")])
@@ -448,6 +489,26 @@ class TestInvalidPipeline:
         with pytest.raises(OutputNotUniqueError, match=r"\['output'\]"):
             pipeline1 + new_pipeline  # pylint: disable=pointless-statement
 
+    def test_combine_circular(self):
+        """Combining acyclic pipelines can produce a circular dependency."""
+        pipeline1 = Pipeline([node(identity, "A", "B", name="node1")])
+        pipeline2 = Pipeline([node(identity, "B", "A", name="node2")])
+        with pytest.raises(CircularDependencyError, match="Circular dependencies"):
+            pipeline1 + pipeline2  # pylint: disable=pointless-statement
+
+    def test_combine_namespaced_inputs_outputs(self):
+        """Transcoded data sets of one pipeline cannot be referenced without
+        the separator in the other.
+        """
+        pipeline1 = Pipeline([node(identity, "A", "B", name="node1")])
+        pipeline2 = Pipeline([node(identity, "B@pandas", "C", name="node2")])
+        pattern = "The following datasets are used with transcoding, "
+        pattern += "but were referenced without the separator: B."
+        with pytest.raises(ValueError, match=pattern):
+            pipeline1 + pipeline2  # pylint: disable=pointless-statement
+        with pytest.raises(ValueError, match=pattern):
+            pipeline2 + pipeline1  # pylint: disable=pointless-statement
+
     def test_namespaced_inputs_outputs(self):
         """Nodes must not refer to a dataset without the separator if
         it is referenced later on in the catalog.
@@ -490,6 +551,39 @@ class TestComplexPipeline:
         assert len(new_pipeline.nodes) == 3
         assert nodes == {"node1", "node2", "node3"}
 
+    def test_from_inputs_same_as_new_pipeline(self, complex_pipeline):
+        """Derived pipelines are sorted the same as newly built ones."""
+        new_pipeline = complex_pipeline.from_inputs("F", "H")
+        expected = Pipeline(new_pipeline.nodes)
+
+        assert new_pipeline.grouped_nodes == expected.grouped_nodes
+        assert new_pipeline.inputs() == expected.inputs()
+        assert new_pipeline.outputs() == expected.outputs()
+
+    def test_from_inputs_with_namespaces(self, pipeline_with_namespaces):
+        """node2 and node3 depend on node1 through transcoded B."""
+        pipeline = Pipeline(pipeline_with_namespaces["nodes"])
+        new_pipeline = pipeline.from_inputs("A")
+        nodes = {node.name for node in new_pipeline.nodes}
+
+        assert nodes == {"node1", "node2", "node3"}
+
+    def test_from_transcoded_input(self, pipeline_with_namespaces):
+        """node2 reads B@pandas, and node3 reads B@spark, the same B."""
+        pipeline = Pipeline(pipeline_with_namespaces["nodes"])
+        new_pipeline = pipeline.from_inputs("B@pandas")
+        nodes = {node.name for node in new_pipeline.nodes}
+
+        assert nodes == {"node2", "node3"}
+
+    def test_from_nodes_with_namespaces(self, pipeline_with_namespaces):
+        """from_nodes agrees with from_inputs on transcoded data sets."""
+        pipeline = Pipeline(pipeline_with_namespaces["nodes"])
+        new_pipeline = pipeline.from_nodes("node1")
+        nodes = {node.name for node in new_pipeline.nodes}
+
+        assert nodes == {"node1", "node2", "node3"}
+
     def test_from_inputs_unknown(self, complex_pipeline):
         """W and Z do not exist as inputs."""
         with pytest.raises(ValueError, match=r"\['W', 'Z'\]"):
@@ -527,6 +621,22 @@ class TestComplexPipeline:
         assert len(new_pipeline.nodes) == 4
         assert nodes == {"node4", "node7", "node8", "node9"}
 
+    def test_to_outputs_with_namespaces(self, pipeline_with_namespaces):
+        """node3 depends on node1 through transcoded B."""
+        pipeline = Pipeline(pipeline_with_namespaces["nodes"])
+        new_pipeline = pipeline.to_outputs("D")
+        nodes = {node.name for node in new_pipeline.nodes}
+
+        assert nodes == {"node1", "node3"}
+
+    def test_to_nodes_with_namespaces(self, pipeline_with_namespaces):
+        """to_nodes agrees with to_outputs on transcoded data sets."""
+        pipeline = Pipeline(pipeline_with_namespaces["nodes"])
+        new_pipeline = pipeline.to_nodes("node3")
+        nodes = {node.name for node in new_pipeline.nodes}
+
+        assert nodes == {"node1", "node3"}
+
     def test_to_outputs_unknown(self, complex_pipeline):
         with pytest.raises(ValueError, match=r"\['W', 'Z'\]"):
             complex_pipeline.to_outputs("Z", "W", "E", "C")
@@ -734,3 +844,11 @@ def test_pipeline_to_json(input_data):
         )
 
     assert kedro.__version__ in json_rep
+
+
+def test_pipeline_to_json_is_valid(input_data):
+    pipeline = Pipeline(input_data["nodes"])
+    json_rep = json.loads(pipeline.to_json())
+
+    assert json_rep["kedro_version"] == kedro.__version__
+    assert [n["name"] for n in json_rep["pipeline"]] == [n.name for n in pipeline.nodes]
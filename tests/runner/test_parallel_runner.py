@@ -34,6 +34,11 @@ from kedro.io import DataCatalog, DataSetError, LambdaDataSet, MemoryDataSet
 from kedro.pipeline import Pipeline, node
 from kedro.pipeline.decorators import log_time
 from kedro.runner import ParallelRunner
+from kedro.runner.parallel_runner import (
+    _children_and_num_parents,
+    _node_catalog,
+    _node_priorities,
+)
 
 
 def identity(input1: str):
@@ -92,8 +97,39 @@ class TestValidParallelRunner:
         assert len(result["Z"]) == 3
         assert result["Z"] == ("42", "42", "42")
 
+    def test_single_worker(self, fan_out_fan_in, catalog):
+        catalog.add_feed_dict(dict(A=42))
+        result = ParallelRunner(max_workers=1).run(fan_out_fan_in, catalog)
+        assert result["Z"] == (42, 42, 42)
+
+    def test_node_priorities(self):
+        """Nodes heading longer chains of dependent nodes come first."""
+        pipeline = Pipeline(
+            [
+                node(identity, "A", "B", name="short"),
+                node(identity, "C", "D", name="long1"),
+                node(identity, "D", "E", name="long2"),
+                node(fan_in, ["B", "E"], "F", name="sink"),
+            ]
+        )
+        children, _ = _children_and_num_parents(pipeline)
+        priorities = _node_priorities(pipeline, children)
+        ranked = [priority[-1].name for priority in sorted(priorities.values())]
+        assert ranked == ["long1", "long2", "short", "sink"]
+
+    def test_node_catalog(self, fan_out_fan_in):
+        catalog = DataCatalog({name: MemoryDataSet(name) for name in "ABCDEZ"})
+        node_catalog = _node_catalog(catalog, fan_out_fan_in.nodes[-1])
+        assert sorted(node_catalog.list()) == ["C", "D", "E", "Z"]
+        assert node_catalog.load("C") == "C"
+
 
 class TestInvalidParallelRunner:
+    @pytest.mark.parametrize("max_workers", [0, -1])
+    def test_invalid_max_workers(self, max_workers):
+        with pytest.raises(ValueError, match="max_workers should be positive"):
+            ParallelRunner(max_workers=max_workers)
+
     def test_task_validation(self, fan_out_fan_in, catalog):
         """ParallelRunner cannot serialize the lambda function."""
         catalog.add_feed_dict(dict(A=42))
@@ -27,6 +27,9 @@
 # limitations under the License.
 
 # pylint: disable=unused-argument
+import gc
+import threading
+import weakref
 from random import random
 
 import pandas as pd
@@ -192,3 +195,123 @@ class TestSeqentialRunnerBranchedPipeline:
         """ds1, ds2 and ds3 were not specified."""
         with pytest.raises(ValueError, match=r"not found in the DataCatalog"):
             SequentialRunner().run(unfinished_outputs_pipeline, DataCatalog())
+
+
+def test_remaining_loads(mocker, memory_catalog):
+    """Every input is set to be loaded once by each node consuming it."""
+    pipeline = Pipeline(
+        [
+            node(identity, "ds1", "A", name="node1"),
+            node(identity, "ds1", "B", name="node2"),
+            node(multi_input_list_output, ["A", "B"], ["C", "D"], name="node3"),
+        ]
+    )
+    mocked = mocker.patch.object(DataCatalog, "set_all_remaining_loads")
+    SequentialRunner().run(pipeline, memory_catalog)
+
+    mocked.assert_called_once_with({"ds1": 2, "A": 1, "B": 1})
+
+
+class TestSequentialRunnerCatalogCopy:
+    def test_default_data_sets_not_registered(self, branchless_pipeline):
+        catalog = DataCatalog({}, {"ds1": 42})
+        SequentialRunner().run(branchless_pipeline, catalog)
+        assert catalog.list() == ["ds1"]
+
+    def test_registered_catalog_not_copied(self, mocker, memory_catalog):
+        pipeline = Pipeline([node(identity, "ds1", "ds2")])
+        shallow_copy = mocker.spy(memory_catalog, "shallow_copy")
+        SequentialRunner().run(pipeline, memory_catalog)
+        assert not shallow_copy.called
+        assert memory_catalog.load("ds2") == {"data": 42}
+
+
+def test_free_outputs_loaded_on_access(mocker, memory_catalog):
+    pipeline = Pipeline(
+        [node(identity, "ds1", "A", name="node1"), node(identity, "ds2", "B")]
+    )
+    outputs = SequentialRunner().run(pipeline, memory_catalog)
+    load = mocker.spy(DataCatalog, "load")
+    assert set(outputs) == {"A", "B"}
+    assert outputs["A"] == {"data": 42}
+    assert outputs["A"] == {"data": 42}
+    assert [call[0][1] for call in load.call_args_list] == ["A"]
+    with pytest.raises(KeyError):
+        outputs["ds1"]  # pylint: disable=pointless-statement
+
+
+def test_intermediates_released(memory_catalog):
+    """Holding the outputs of a run does not keep its intermediate data."""
+    runner = SequentialRunner()
+    default_data_sets = {}
+
+    def _create_default_data_set(ds_name):
+        data_set = MemoryDataSet()
+        default_data_sets[ds_name] = weakref.ref(data_set)
+        return data_set
+
+    runner.create_default_data_set = _create_default_data_set
+    pipeline = Pipeline([node(identity, "ds1", "mid"), node(identity, "mid", "out")])
+    outputs = runner.run(pipeline, memory_catalog)
+    gc.collect()
+
+    assert default_data_sets["mid"]() is None
+    assert outputs["out"] == {"data": 42}
+
+
+class TestSequentialRunnerPrefetch:
+    def test_prefetch(self, memory_catalog, unfinished_outputs_pipeline):
+        memory_catalog.add_feed_dict({"ds3": 3})
+        outputs = SequentialRunner(prefetch=True).run(
+            unfinished_outputs_pipeline, memory_catalog
+        )
+        assert outputs == {"ds5": [1, 2, 3, 4, 5], "ds6": 3, "ds8": {"data": 42}}
+
+    def test_prefetch_chain(self, branchless_no_input_pipeline):
+        """Every node consumes the output of the previous one."""
+        outputs = SequentialRunner(prefetch=True).run(
+            branchless_no_input_pipeline, DataCatalog()
+        )
+        assert isinstance(outputs["E"], float)
+
+    def test_prefetched_inputs_loaded_once(self, mocker, memory_catalog):
+        pipeline = Pipeline(
+            [
+                node(identity, "ds1", "A", name="node1"),
+                node(multi_input_list_output, ["A", "ds2"], ["B", "C"], name="node2"),
+            ]
+        )
+        load = mocker.spy(DataCatalog, "load")
+        SequentialRunner(prefetch=True).run(pipeline, memory_catalog)
+        loaded = sorted(call[0][1] for call in load.call_args_list)
+        assert loaded == ["A", "ds1", "ds2"]
+
+    def test_shared_input_not_prefetched(self, mocker, memory_catalog):
+        """ds1 is read by both nodes, so it is only loaded by the main thread,
+        never while the other node is loading it."""
+        pipeline = Pipeline(
+            [
+                node(identity, "ds1", "A", name="node1"),
+                node(multi_input_list_output, ["A", "ds1"], ["B", "C"], name="node2"),
+            ]
+        )
+        threads = []
+        load = DataCatalog.load
+
+        def _load(catalog, name):
+            threads.append((name, threading.current_thread()))
+            return load(catalog, name)
+
+        mocker.patch.object(DataCatalog, "load", _load)
+        outputs = SequentialRunner(prefetch=True).run(pipeline, memory_catalog)
+
+        assert dict(outputs) == {"B": {"data": 42}, "C": {"data": 42}}
+        ds1_threads = [thread for name, thread in threads if name == "ds1"]
+        assert ds1_threads == [threading.main_thread()] * 2
+
+    def test_no_pool_without_prefetch(self, mocker, branchless_pipeline):
+        pool = mocker.patch("kedro.runner.sequential_runner.ThreadPoolExecutor")
+        catalog = DataCatalog({}, {"ds1": 42})
+        outputs = SequentialRunner().run(branchless_pipeline, catalog)
+        assert outputs["ds3"] == 42
+        pool.assert_not_called()